@@ -5,6 +5,7 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from sqlite3 import Row
 from typing import Any, ClassVar, Dict, List, Optional, Union
 
@@ -23,6 +24,7 @@ from .crypto.keys import (
     derive_keyset_id,
     derive_keyset_id_deprecated,
     derive_pubkeys,
+    deserialize_pubkeys,
 )
 from .crypto.secp import PrivateKey, PublicKey
 from .legacy import derive_keys_backwards_compatible_insecure_pre_0_12
@@ -688,17 +690,13 @@ class WalletKeyset:
 
     @classmethod
     def from_row(cls, row: Row):
-        def deserialize(serialized: str) -> Dict[int, PublicKey]:
-            return {
-                int(amount): PublicKey(bytes.fromhex(hex_key), raw=True)
-                for amount, hex_key in dict(json.loads(serialized)).items()
-            }
-
         return cls(
             id=row["id"],
             unit=row["unit"],
             public_keys=(
-                deserialize(str(row["public_keys"]))
+                deserialize_pubkeys(
+                    json.loads(str(row["public_keys"])), keyset_id=row["id"]
+                )
                 if dict(row).get("public_keys")
                 else {}
             ),
@@ -934,6 +932,10 @@ class TokenV3Token(BaseModel):
         return return_dict
 
 
+# serialized tokens longer than this are parsed without caching them
+TOKEN_CACHE_MAX_LENGTH = 4096
+
+
 @dataclass
 class TokenV3(Token):
     """
@@ -994,7 +996,23 @@ class TokenV3(Token):
     def deserialize(cls, tokenv3_serialized: str) -> "TokenV3":
         """
         Ingesta a serialized "cashuA<json_urlsafe_base64>" token and returns a TokenV3.
+
+        Parsed tokens are cached by their serialization. Callers receive a deep copy
+        so that modifying the proofs of the returned token does not alter the cache.
+        Large tokens are not cached.
         """
+        if len(tokenv3_serialized) > TOKEN_CACHE_MAX_LENGTH:
+            return cls._deserialize_cached.__wrapped__(tokenv3_serialized)
+        token = cls._deserialize_cached(tokenv3_serialized)
+        return cls(
+            token=[t.copy(deep=True) for t in token.token],
+            _memo=token._memo,
+            _unit=token._unit,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _deserialize_cached(tokenv3_serialized: str) -> "TokenV3":
         prefix = "cashuA"
         assert tokenv3_serialized.startswith(prefix), Exception(
             f"Token prefix not valid. Expected {prefix}."
@@ -1004,7 +1022,7 @@ class TokenV3(Token):
         token_base64 += "=" * (4 - len(token_base64) % 4)
 
         token = json.loads(base64.urlsafe_b64decode(token_base64))
-        return cls.parse_obj(token)
+        return TokenV3.parse_obj(token)
 
     def serialize(self, include_dleq=False) -> str:
         """
@@ -1,7 +1,8 @@
+import asyncio
 import base64
 import hashlib
 import random
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from bip32 import BIP32
 
@@ -53,6 +54,59 @@ def derive_pubkeys(keys: Dict[int, PrivateKey], amounts: List[int]):
     return {amt: keys[amt].pubkey for amt in amounts}
 
 
+# parsed public keys per keyset id, together with the hex keys they were parsed from
+_keyset_pubkeys: Dict[str, Tuple[Dict[int, str], Dict[int, PublicKey]]] = {}
+
+
+def get_cached_pubkeys(
+    keyset_id: str, keys: Dict[Any, str]
+) -> Optional[Dict[int, PublicKey]]:
+    """Returns the parsed public keys of a keyset if they are cached, None otherwise."""
+    cached = _keyset_pubkeys.get(keyset_id)
+    if cached is None:
+        return None
+    hex_keys, public_keys = cached
+    if hex_keys != {int(amount): hex_key for amount, hex_key in keys.items()}:
+        return None
+    return dict(public_keys)
+
+
+def deserialize_pubkeys(
+    keys: Dict[Any, str], keyset_id: Optional[str] = None
+) -> Dict[int, PublicKey]:
+    """Parses a mapping of amounts to hex-encoded public keys of a keyset.
+
+    Wallets load the same keysets over and over again from the mint and from their
+    database. If a keyset id is given, the parsed keys are cached for that keyset.
+    The returned keys must not be modified in place.
+    """
+    if keyset_id:
+        cached = get_cached_pubkeys(keyset_id, keys)
+        if cached is not None:
+            return cached
+    hex_keys = {int(amount): hex_key for amount, hex_key in keys.items()}
+    public_keys = {
+        amount: PublicKey(bytes.fromhex(hex_key), raw=True)
+        for amount, hex_key in hex_keys.items()
+    }
+    if keyset_id:
+        _keyset_pubkeys[keyset_id] = (hex_keys, public_keys)
+        return dict(public_keys)
+    return public_keys
+
+
+async def deserialize_pubkeys_async(
+    keys: Dict[Any, str], keyset_id: Optional[str] = None
+) -> Dict[int, PublicKey]:
+    """Like deserialize_pubkeys, but keys that are not cached yet are parsed in a
+    worker thread so that the event loop is not blocked."""
+    if keyset_id:
+        cached = get_cached_pubkeys(keyset_id, keys)
+        if cached is not None:
+            return cached
+    return await asyncio.to_thread(deserialize_pubkeys, keys, keyset_id)
+
+
 def derive_keyset_id(keys: Dict[int, PublicKey]):
     """Deterministic derivation keyset_id from set of public keys."""
     # sort public keys by amount
@@ -1,4 +1,5 @@
 import json
+import re
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
@@ -13,6 +14,10 @@ class SecretKind(Enum):
     HTLC = "HTLC"
 
 
+# matches the kind at the start of a serialized secret: ["<kind>", {...}]
+SECRET_KIND_REGEX = re.compile(r'^\s*\[\s*"([^"\\]+)"')
+
+
 class Tags(BaseModel):
     """
     Tags are used to encode additional information in the Secret of a Proof.
@@ -62,12 +67,25 @@ class Secret(BaseModel):
             "nonce": self.nonce or PrivateKey().serialize()[:32],
         }
         if self.tags.__root__:
-            logger.debug(f"Serializing tags: {self.tags.__root__}")
+            logger.debug("Serializing tags: {}", self.tags.__root__)
             data_dict["tags"] = self.tags.__root__
         return json.dumps(
             [self.kind, data_dict],
         )
 
+    @staticmethod
+    def peek_kind(from_proof: str) -> Optional[str]:
+        """Returns the kind of a serialized secret without deserializing it.
+
+        Args:
+            from_proof (str): Secret of a proof
+
+        Returns:
+            Optional[str]: Kind of the secret or None if it is not a serialized secret
+        """
+        match = SECRET_KIND_REGEX.match(from_proof)
+        return match.group(1) if match else None
+
     @classmethod
     def deserialize(cls, from_proof: str):
         kind, kwargs = json.loads(from_proof)
@@ -75,5 +93,5 @@ class Secret(BaseModel):
         nonce = kwargs.pop("nonce")
         tags_list: List = kwargs.pop("tags", None)
         tags = Tags(tags=tags_list)
-        logger.debug(f"Deserialized Secret: {kind}, {data}, {nonce}, {tags}")
+        logger.debug("Deserialized Secret: {}, {}, {}, {}", kind, data, nonce, tags)
         return cls(kind=kind, data=data, nonce=nonce, tags=tags)
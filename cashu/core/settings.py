@@ -192,6 +192,7 @@ class WalletSettings(CashuSettings):
 
     locktime_delta_seconds: int = Field(default=86400)  # 1 day
     proofs_batch_size: int = Field(default=1000)
+    restore_batch_size: int = Field(default=100, gt=0)
 
     wallet_target_amount_count: int = Field(default=3)
 
@@ -5,9 +5,10 @@ def amount_split(amount: int) -> List[int]:
     """Given an amount returns a list of amounts returned e.g. 13 is [1, 4, 8]."""
     if amount <= 0:
         return []
-    bits_amt = bin(amount)[::-1][:-2]
     rv = []
-    for pos, bit in enumerate(bits_amt):
-        if bit == "1":
-            rv.append(2**pos)
+    while amount:
+        # isolate the lowest set bit, one iteration per bit set in amount
+        lowest_bit = amount & -amount
+        rv.append(lowest_bit)
+        amount ^= lowest_bit
     return rv
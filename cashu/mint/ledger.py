@@ -89,6 +89,7 @@ class Ledger(LedgerVerification, LedgerSpendingConditions, LedgerTasks, LedgerFe
         crud=LedgerCrudSqlite(),
     ) -> None:
         self.keysets: Dict[str, MintKeyset] = {}
+        self._active_keysets: Dict[Unit, MintKeyset] = {}
         self.backends: Mapping[Method, Mapping[Unit, LightningBackend]] = {}
         self.events = LedgerEventManager()
         self.db_read: DbReadHelper
@@ -245,6 +246,7 @@ class Ledger(LedgerVerification, LedgerSpendingConditions, LedgerTasks, LedgerFe
         # Activate the keyset
         keyset.active = True
         self.keysets[keyset.id] = keyset
+        self._update_active_keysets()
         logger.debug(f"Keyset with ID '{keyset.id}' is now active.")
 
         return keyset
@@ -264,6 +266,7 @@ class Ledger(LedgerVerification, LedgerSpendingConditions, LedgerTasks, LedgerFe
         # add keysets from db to memory
         for k in tmp_keysets:
             self.keysets[k.id] = k
+        self._update_active_keysets()
 
         logger.info(f"Loaded {len(self.keysets)} keysets from database.")
 
@@ -312,6 +315,31 @@ class Ledger(LedgerVerification, LedgerSpendingConditions, LedgerTasks, LedgerFe
                 keyset.active = False
                 self.keysets[keyset.id] = keyset
                 await self.crud.update_keyset(keyset=keyset, db=self.db)
+        self._update_active_keysets()
+
+    def _update_active_keysets(self) -> None:
+        """Indexes the first active keyset of each unit in self.keysets. Needs to be
+        called whenever a keyset is added to self.keysets or its active flag changes."""
+        self._active_keysets = {}
+        for keyset in self.keysets.values():
+            if keyset.active:
+                self._active_keysets.setdefault(keyset.unit, keyset)
+
+    def get_active_keyset(self, unit: Unit) -> MintKeyset:
+        """Returns the active keyset of a unit.
+
+        Args:
+            unit (Unit): Unit of the keyset
+
+        Returns:
+            MintKeyset: First active keyset of the unit
+
+        Raises:
+            KeysetError: If there is no active keyset for this unit
+        """
+        if unit not in self._active_keysets:
+            raise KeysetError(f"No active keyset found for unit {unit.name}.")
+        return self._active_keysets[unit]
 
     def get_keyset(self, keyset_id: Optional[str] = None) -> Dict[int, str]:
         """Returns a dictionary of hex public keys of a specific keyset for each supported amount"""
@@ -454,9 +482,7 @@ class Ledger(LedgerVerification, LedgerSpendingConditions, LedgerTasks, LedgerFe
         # MINT_MAX_BALANCE refers to sat (for now)
         if settings.mint_max_balance and unit == Unit.sat:
             # get next active keyset for unit
-            active_keyset: MintKeyset = next(
-                filter(lambda k: k.active and k.unit == unit, self.keysets.values())
-            )
+            active_keyset = self.get_active_keyset(unit)
             balance = await self.get_balance(active_keyset)
             if balance + quote_request.amount > settings.mint_max_balance:
                 raise NotAllowedError("Mint has reached maximum balance.")
@@ -59,6 +59,7 @@ from ..helpers import (
     receive,
     send,
 )
+from ..http_pool import close_httpx_clients
 from ..nostr import receive_nostr, send_nostr
 from ..subscriptions import SubscriptionManager
 
@@ -81,7 +82,13 @@ def run_api_server(ctx, param, daemon):
 def coro(f):
     @wraps(f)
     def wrapper(*args, **kwargs):
-        return asyncio.run(f(*args, **kwargs))
+        async def run():
+            try:
+                return await f(*args, **kwargs)
+            finally:
+                await close_httpx_clients()
+
+        return asyncio.run(run())
 
     return wrapper
 
@@ -1,6 +1,6 @@
 import hashlib
 import os
-from typing import Optional
+from typing import Dict, Optional
 
 from loguru import logger
 
@@ -46,18 +46,22 @@ async def redeem_TokenV3(wallet: Wallet, token: TokenV3) -> Wallet:
         if keysets:
             token.unit = keysets[0].unit.name
 
+    # one wallet per mint, a token can contain several entries of the same mint
+    mint_wallets: Dict[str, Wallet] = {}
     for t in token.token:
         assert t.mint, Exception("redeem_TokenV3: multimint redeem without URL")
-        mint_wallet = await Wallet.with_db(
-            t.mint,
-            os.path.join(settings.cashu_dir, wallet.name),
-            unit=token.unit or wallet.unit.name,
-            auth_db=wallet.auth_db.db_location if wallet.auth_db else None,
-            auth_keyset_id=wallet.auth_keyset_id,
-        )
-        keyset_ids = mint_wallet._get_proofs_keyset_ids(t.proofs)
-        logger.trace(f"Keysets in tokens: {' '.join(set(keyset_ids))}")
-        await mint_wallet.load_mint()
+        if t.mint not in mint_wallets:
+            mint_wallets[t.mint] = await Wallet.with_db(
+                t.mint,
+                os.path.join(settings.cashu_dir, wallet.name),
+                unit=token.unit or wallet.unit.name,
+                auth_db=wallet.auth_db.db_location if wallet.auth_db else None,
+                auth_keyset_id=wallet.auth_keyset_id,
+            )
+            await mint_wallets[t.mint].load_mint()
+        mint_wallet = mint_wallets[t.mint]
+        keyset_ids = {p.id for p in t.proofs}
+        logger.trace(f"Keysets in tokens: {' '.join(keyset_ids)}")
         proofs_to_keep, _ = await mint_wallet.redeem(t.proofs)
         print(f"Received {mint_wallet.unit.str(sum_proofs(proofs_to_keep))}")
 
@@ -134,9 +138,9 @@ async def send(
             raise Exception("Error: lock has to start with P2PK:")
         # we add a time lock to the P2PK lock by appending the current unix time + 14 days
         else:
-            logger.debug(f"Locking token to: {lock}")
+            logger.debug("Locking token to: {}", lock)
             logger.debug(
-                f"Adding a time lock of {settings.locktime_delta_seconds} seconds."
+                "Adding a time lock of {} seconds.", settings.locktime_delta_seconds
             )
             secret_lock = await wallet.create_p2pk_lock(
                 lock.split(":")[1],
@@ -144,7 +148,7 @@ async def send(
                 sig_all=False,
                 n_sigs=1,
             )
-            logger.debug(f"Secret lock: {secret_lock}")
+            logger.debug("Secret lock: {}", secret_lock)
 
     await wallet.load_proofs()
 
@@ -1,5 +1,5 @@
 import hashlib
-from datetime import datetime, timedelta
+import time
 from typing import List
 
 from ..core.base import HTLCWitness, Proof
@@ -26,9 +26,7 @@ class WalletHTLC(SupportsDb):
     ) -> HTLCSecret:
         tags = Tags()
         if locktime_seconds:
-            tags["locktime"] = str(
-                int((datetime.now() + timedelta(seconds=locktime_seconds)).timestamp())
-            )
+            tags["locktime"] = str(int(time.time()) + locktime_seconds)
         if locktime_pubkeys:
             tags["refund"] = locktime_pubkeys
 
@@ -0,0 +1,66 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from ..core.settings import settings
+
+ClientKey = Tuple[str, Optional[str], bool]
+LoopClients = Dict[ClientKey, httpx.AsyncClient]
+
+# connections can't be shared between event loops, so we keep the clients per loop.
+# The loop is stored with its clients so that its id can't be reused while the
+# entry exists. Entries of closed loops are dropped on the next lookup.
+_clients: Dict[int, Tuple[AbstractEventLoop, LoopClients]] = {}
+
+
+def _evict_closed_loops() -> None:
+    for loop_id, (loop, _) in list(_clients.items()):
+        if loop.is_closed():
+            del _clients[loop_id]
+
+
+def get_httpx_client(
+    base_url: str, proxy_url: Optional[str] = None
+) -> httpx.AsyncClient:
+    """Returns a shared client for requests to a mint.
+
+    Clients are reused across API calls and wallet instances that talk to the same
+    base URL through the same proxy, so that connections to the mint are kept alive.
+    The clients reject all cookies, so that the mint can't use them to link the
+    requests of a wallet.
+
+    Args:
+        base_url (str): URL of the mint
+        proxy_url (Optional[str], optional): Proxy to route all requests through.
+            Defaults to None.
+
+    Returns:
+        httpx.AsyncClient: Client for the current event loop
+    """
+    _evict_closed_loops()
+    loop = asyncio.get_running_loop()
+    _, clients = _clients.setdefault(id(loop), (loop, {}))
+    key = (base_url, proxy_url, settings.debug)
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            verify=not settings.debug,
+            proxies={"all://": proxy_url} if proxy_url else {},  # type: ignore
+            headers={"Client-version": settings.version},
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            base_url=base_url,
+            timeout=None if settings.debug else 60,
+        )
+        clients[key] = client
+    return client
+
+
+async def close_httpx_clients() -> None:
+    """Closes all shared clients of the current event loop. Should be awaited before
+    the loop is closed."""
+    loop = asyncio.get_running_loop()
+    _, clients = _clients.pop(id(loop), (loop, {}))
+    await asyncio.gather(*[client.aclose() for client in clients.values()])
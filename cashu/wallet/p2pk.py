@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+import time
 from typing import List, Optional
 
 from loguru import logger
@@ -41,20 +41,18 @@ class WalletP2PK(SupportsPrivateKey, SupportsDb):
         sig_all: bool = False,
         n_sigs: int = 1,
     ) -> P2PKSecret:
-        logger.debug(f"Provided tags: {tags}")
+        logger.debug("Provided tags: {}", tags)
         if not tags:
             tags = Tags()
-            logger.debug(f"Before tags: {tags}")
+            logger.debug("Before tags: {}", tags)
         if locktime_seconds:
-            tags["locktime"] = str(
-                int((datetime.now() + timedelta(seconds=locktime_seconds)).timestamp())
-            )
+            tags["locktime"] = str(int(time.time()) + locktime_seconds)
         tags["sigflag"] = (
             SigFlags.SIG_ALL.value if sig_all else SigFlags.SIG_INPUTS.value
         )
         if n_sigs > 1:
             tags["n_sigs"] = str(n_sigs)
-        logger.debug(f"After tags: {tags}")
+        logger.debug("After tags: {}", tags)
         return P2PKSecret(
             kind=SecretKind.P2PK.value,
             data=pubkey,
@@ -72,13 +70,12 @@ class WalletP2PK(SupportsPrivateKey, SupportsDb):
         """
         private_key = self.private_key
         assert private_key.pubkey
-        logger.trace(
-            f"Signing with private key: {private_key.serialize()} public key:"
-            f" {private_key.pubkey.serialize().hex()}"
+        logger.opt(lazy=True).trace(
+            "Signing with private key: {} public key: {}",
+            private_key.serialize,
+            lambda: private_key.pubkey.serialize().hex(),
         )
-        for proof in proofs:
-            logger.trace(f"Signing proof: {proof}")
-            logger.trace(f"Signing message: {proof.secret}")
+        logger.trace("Signing proofs: {}", proofs)
 
         signatures = [
             schnorr_sign(
@@ -87,7 +84,7 @@ class WalletP2PK(SupportsPrivateKey, SupportsDb):
             ).hex()
             for proof in proofs
         ]
-        logger.debug(f"Signatures: {signatures}")
+        logger.debug("Signatures: {}", signatures)
         return signatures
 
     def sign_outputs(self, outputs: List[BlindedMessage]) -> List[str]:
@@ -126,21 +123,22 @@ class WalletP2PK(SupportsPrivateKey, SupportsDb):
         Returns:
             List[BlindedMessage]: Outputs with signatures added
         """
+        # serialized secrets are JSON lists, so regular token secrets can be
+        # ruled out without attempting to parse them
+        if not all(p.secret.lstrip().startswith("[") for p in proofs):
+            return outputs
         # first we check whether all tokens have serialized secrets as their secret
         try:
-            for p in proofs:
-                secret = Secret.deserialize(p.secret)
+            secrets = [Secret.deserialize(p.secret) for p in proofs]
         except Exception:
             # if not, we do not add witnesses (treat as regular token secret)
             return outputs
 
         # if any of the proofs provided is P2PK and requires SIG_ALL, we must signatures to all outputs
         if any(
-            [
-                secret.kind == SecretKind.P2PK.value
-                and P2PKSecret.deserialize(p.secret).sigflag == SigFlags.SIG_ALL
-                for p in proofs
-            ]
+            secret.kind == SecretKind.P2PK.value
+            and P2PKSecret.from_secret(secret).sigflag == SigFlags.SIG_ALL
+            for secret in secrets
         ):
             outputs = self.add_signature_witnesses_to_outputs(outputs)
         return outputs
@@ -173,16 +171,10 @@ class WalletP2PK(SupportsPrivateKey, SupportsDb):
         Returns:
             List[Proof]: List of proofs with witnesses added
         """
-        # first we check whether all tokens have serialized secrets as their secret
-        try:
-            for p in proofs:
-                secret = Secret.deserialize(p.secret)
-        except Exception:
-            # if not, we do not add witnesses (treat as regular token secret)
-            return proofs
-        logger.debug("Spending conditions detected.")
-        # check if all secrets are either P2PK or HTLC
-        if all([secret.kind == SecretKind.P2PK.value for p in proofs]):
+        # check if all secrets are P2PK, only the kind is needed to decide this so
+        # we don't deserialize the secrets (regular token secrets have no kind)
+        if all(Secret.peek_kind(p.secret) == SecretKind.P2PK.value for p in proofs):
+            logger.debug("Spending conditions detected.")
             proofs = self.add_signature_witnesses_to_proofs(proofs)
 
         # if all([secret.kind == SecretKind.HTLC.value for p in proofs]):
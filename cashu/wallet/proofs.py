@@ -34,8 +34,11 @@ class WalletProofs(SupportsDb, SupportsKeysets):
         self, proofs: List[Proof], unit: Optional[Unit] = None
     ) -> Dict[str, List[Proof]]:
         ret: Dict[str, List[Proof]] = {}
-        keyset_ids = {p.id for p in proofs}
-        for id in keyset_ids:
+        # bucket proofs by keyset id in a single pass
+        proofs_per_keyset: Dict[str, List[Proof]] = {}
+        for p in proofs:
+            proofs_per_keyset.setdefault(p.id, []).append(p)
+        for id, keyset_proofs in proofs_per_keyset.items():
             if id is None:
                 continue
             keysets_crud = await get_keysets(id=id, db=self.db)
@@ -44,10 +47,7 @@ class WalletProofs(SupportsDb, SupportsKeysets):
             if unit and keyset.unit != unit:
                 continue
             assert keyset.mint_url
-            if keyset.mint_url not in ret:
-                ret[keyset.mint_url] = [p for p in proofs if p.id == id]
-            else:
-                ret[keyset.mint_url].extend([p for p in proofs if p.id == id])
+            ret.setdefault(keyset.mint_url, []).extend(keyset_proofs)
         return ret
 
     def _get_proofs_per_unit(self, proofs: List[Proof]) -> Dict[Unit, List[Proof]]:
@@ -92,7 +92,7 @@ class WalletProofs(SupportsDb, SupportsKeysets):
         return mint_urls
 
     async def _get_proofs_keysets(self, proofs: List[Proof]) -> Dict[str, WalletKeyset]:
-        keyset_ids = self._get_proofs_keyset_ids(proofs)
+        keyset_ids = set(self._get_proofs_keyset_ids(proofs))
         keysets_dict = {}
         async with self.db.get_connection() as conn:
             for keyset_id in keyset_ids:
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import hashlib
 import os
@@ -111,6 +112,21 @@ class WalletSecrets(SupportsDb, SupportsKeysets):
         Determinstically generates two secrets (one as the secret message,
         one as the blinding factor).
         """
+        return self._derive_determinstic_secret(counter, keyset_id)
+
+    def _derive_determinstic_secrets(
+        self, counters: List[int], keyset_id: Optional[str] = None
+    ) -> List[Tuple[bytes, bytes, str]]:
+        """Derives the secrets and blinding factors for all `counters`.
+
+        BIP32 derivation is CPU-bound. Callers should run this method in a worker
+        thread so that it does not block the event loop.
+        """
+        return [self._derive_determinstic_secret(c, keyset_id) for c in counters]
+
+    def _derive_determinstic_secret(
+        self, counter: int, keyset_id: Optional[str] = None
+    ) -> Tuple[bytes, bytes, str]:
         assert self.bip32, "BIP32 not initialized yet."
         keyset_id = keyset_id or self.keyset_id
         # integer keyset id modulo max number of bip32 child keys
@@ -167,9 +183,9 @@ class WalletSecrets(SupportsDb, SupportsKeysets):
             logger.trace(
                 f"Generating secret nr {secret_counters[0]} to {secret_counters[-1]}."
             )
-            secrets_rs_derivationpaths = [
-                await self.generate_determinstic_secret(s) for s in secret_counters
-            ]
+            secrets_rs_derivationpaths = await asyncio.to_thread(
+                self._derive_determinstic_secrets, secret_counters
+            )
             # secrets are supplied as str
             secrets = [s[0].hex() for s in secrets_rs_derivationpaths]
             # rs are supplied as PrivateKey
@@ -201,10 +217,9 @@ class WalletSecrets(SupportsDb, SupportsKeysets):
             from_counter <= to_counter
         ), "from_counter must be smaller than to_counter"
         secret_counters = [c for c in range(from_counter, to_counter + 1)]
-        secrets_rs_derivationpaths = [
-            await self.generate_determinstic_secret(s, keyset_id)
-            for s in secret_counters
-        ]
+        secrets_rs_derivationpaths = await asyncio.to_thread(
+            self._derive_determinstic_secrets, secret_counters, keyset_id
+        )
         # secrets are supplied as str
         secrets = [s[0].hex() for s in secrets_rs_derivationpaths]
         # rs are supplied as PrivateKey
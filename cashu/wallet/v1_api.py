@@ -1,3 +1,4 @@
+import asyncio
 import json
 import uuid
 from posixpath import join
@@ -22,7 +23,7 @@ from ..core.base import (
     Unit,
     WalletKeyset,
 )
-from ..core.crypto.secp import PublicKey
+from ..core.crypto.keys import deserialize_pubkeys_async
 from ..core.db import Database
 from ..core.models import (
     CheckFeesResponse_deprecated,
@@ -54,6 +55,7 @@ from .crud import (
     get_proofs,
     invalidate_proof,
 )
+from .http_pool import get_httpx_client
 from .protocols import SupportsAuth
 from .wallet_deprecated import LedgerAPIDeprecated
 
@@ -70,7 +72,6 @@ def async_set_httpx_client(func):
 
     async def wrapper(self, *args, **kwargs):
         # set proxy
-        proxies_dict = {}
         proxy_url: Union[str, None] = None
         if settings.tor and TorProxy().check_platform():
             self.tor = TorProxy(timeout=True)
@@ -80,18 +81,8 @@ def async_set_httpx_client(func):
             proxy_url = f"socks5://{settings.socks_proxy}"
         elif settings.http_proxy:
             proxy_url = settings.http_proxy
-        if proxy_url:
-            proxies_dict.update({"all://": proxy_url})
 
-        headers_dict = {"Client-version": settings.version}
-
-        self.httpx = httpx.AsyncClient(
-            verify=not settings.debug,
-            proxies=proxies_dict,  # type: ignore
-            headers=headers_dict,
-            base_url=self.url.rstrip("/"),
-            timeout=None if settings.debug else 60,
-        )
+        self.httpx = get_httpx_client(self.url.rstrip("/"), proxy_url)
         return await func(self, *args, **kwargs)
 
     return wrapper
@@ -136,6 +127,10 @@ class LedgerAPI(LedgerAPIDeprecated, SupportsAuth):
         Raises:
             Exception: if the response contains an error
         """
+        # the mint only reports errors with an error status, successful
+        # responses are parsed by the caller and don't need to be decoded here
+        if resp.is_success:
+            return
         try:
             resp_dict = resp.json()
         except json.JSONDecodeError:
@@ -220,17 +215,18 @@ class LedgerAPI(LedgerAPIDeprecated, SupportsAuth):
         keys = KeysResponse.parse_obj(keys_dict)
         keysets_str = " ".join([f"{k.id} ({k.unit})" for k in keys.keysets])
         logger.debug(f"Received {len(keys.keysets)} keysets from mint: {keysets_str}.")
+        # cached keysets are returned directly, new ones are parsed off the event loop
+        keysets_keys = await asyncio.gather(
+            *[deserialize_pubkeys_async(k.keys, k.id) for k in keys.keysets]
+        )
         ret = [
             WalletKeyset(
                 id=keyset.id,
                 unit=keyset.unit,
-                public_keys={
-                    int(amt): PublicKey(bytes.fromhex(val), raw=True)
-                    for amt, val in keyset.keys.items()
-                },
+                public_keys=keyset_keys,
                 mint_url=self.url,
             )
-            for keyset in keys.keysets
+            for keyset, keyset_keys in zip(keys.keysets, keysets_keys)
         ]
         return ret
 
@@ -262,10 +258,7 @@ class LedgerAPI(LedgerAPIDeprecated, SupportsAuth):
         assert len(keys_dict), Exception("did not receive any keys")
         keys = KeysResponse.parse_obj(keys_dict)
         this_keyset = keys.keysets[0]
-        keyset_keys = {
-            int(amt): PublicKey(bytes.fromhex(val), raw=True)
-            for amt, val in this_keyset.keys.items()
-        }
+        keyset_keys = await deserialize_pubkeys_async(this_keyset.keys, keyset_id)
         keyset = WalletKeyset(
             id=keyset_id,
             unit=this_keyset.unit,
@@ -598,8 +591,7 @@ class LedgerAPI(LedgerAPIDeprecated, SupportsAuth):
         # END backwards compatibility < 0.15.0
         self.raise_on_error_request(resp)
         promises_dict = resp.json()
-        mint_response = PostSwapResponse.parse_obj(promises_dict)
-        promises = [BlindedSignature(**p.dict()) for p in mint_response.signatures]
+        promises = PostSwapResponse.parse_obj(promises_dict).signatures
 
         if len(promises) == 0:
             raise Exception("received no splits.")
@@ -660,7 +652,25 @@ class LedgerAPI(LedgerAPIDeprecated, SupportsAuth):
     ) -> Tuple[List[BlindedMessage], List[BlindedSignature]]:
         """
         Asks the mint to restore promises corresponding to outputs.
+
+        Large sets of outputs are sent one after another in requests of at most
+        `settings.restore_batch_size` outputs each. The requests are not sent
+        concurrently, since each of them may spend a blind auth token.
         """
+        batch_size = settings.restore_batch_size
+        restored_outputs: List[BlindedMessage] = []
+        restored_promises: List[BlindedSignature] = []
+        for i in range(0, len(outputs), batch_size):
+            batch_outputs, batch_promises = await self._restore_promises_batch(
+                outputs[i : i + batch_size]
+            )
+            restored_outputs.extend(batch_outputs)
+            restored_promises.extend(batch_promises)
+        return restored_outputs, restored_promises
+
+    async def _restore_promises_batch(
+        self, outputs: List[BlindedMessage]
+    ) -> Tuple[List[BlindedMessage], List[BlindedSignature]]:
         payload = PostMintRequest(quote="restore", outputs=outputs)
         resp = await self._request(POST, "restore", json=payload.dict())
         # BEGIN backwards compatibility < 0.15.0
@@ -1,5 +1,4 @@
 import json
-from posixpath import join
 from typing import List, Optional, Tuple, Union
 
 import bolt11
@@ -15,7 +14,7 @@ from ..core.base import (
     Proof,
     WalletKeyset,
 )
-from ..core.crypto.secp import PublicKey
+from ..core.crypto.keys import deserialize_pubkeys_async
 from ..core.models import (
     CheckFeesRequest_deprecated,
     CheckFeesResponse_deprecated,
@@ -23,20 +22,17 @@ from ..core.models import (
     CheckSpendableResponse_deprecated,
     GetInfoResponse,
     GetInfoResponse_deprecated,
-    GetMintResponse_deprecated,
-    KeysetsResponse_deprecated,
     KeysetsResponseKeyset,
     PostMeltRequest_deprecated,
     PostMeltResponse_deprecated,
     PostMintQuoteResponse,
     PostMintRequest_deprecated,
-    PostMintResponse_deprecated,
     PostRestoreResponse,
     PostSwapRequest_Deprecated,
-    PostSwapResponse_Deprecated,
 )
 from ..core.settings import settings
 from ..tor.tor import TorProxy
+from .http_pool import get_httpx_client
 from .protocols import SupportsHttpxClient, SupportsMintURL
 
 
@@ -49,7 +45,6 @@ def async_set_httpx_client(func):
 
     async def wrapper(self, *args, **kwargs):
         # set proxy
-        proxies_dict = {}
         proxy_url: Union[str, None] = None
         if settings.tor and TorProxy().check_platform():
             self.tor = TorProxy(timeout=True)
@@ -59,18 +54,8 @@ def async_set_httpx_client(func):
             proxy_url = f"socks5://{settings.socks_proxy}"
         elif settings.http_proxy:
             proxy_url = settings.http_proxy
-        if proxy_url:
-            proxies_dict.update({"all://": proxy_url})
 
-        headers_dict = {"Client-version": settings.version}
-
-        self.httpx = httpx.AsyncClient(
-            verify=not settings.debug,
-            proxies=proxies_dict,  # type: ignore
-            headers=headers_dict,
-            base_url=self.url,
-            timeout=None if settings.debug else 60,
-        )
+        self.httpx = get_httpx_client(self.url, proxy_url)
         return await func(self, *args, **kwargs)
 
     return wrapper
@@ -107,6 +92,10 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         Raises:
             Exception: if the response contains an error
         """
+        # the mint only reports errors with an error status, successful
+        # responses are parsed by the caller and don't need to be decoded here
+        if resp.is_success:
+            return
         try:
             resp_dict = resp.json()
         except json.JSONDecodeError:
@@ -134,7 +123,7 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         """
         logger.warning(f"Using deprecated API call: {self.url}/info")
         resp = await self.httpx.get(
-            join(self.url, "/info"),
+            "/info",
         )
         self.raise_on_error(resp)
         data: dict = resp.json()
@@ -163,15 +152,12 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         """
         logger.warning(f"Using deprecated API call: {url}/keys")
         resp = await self.httpx.get(
-            f"{url}/keys",
+            "/keys",
         )
         self.raise_on_error(resp)
         keys: dict = resp.json()
         assert len(keys), Exception("did not receive any keys")
-        keyset_keys = {
-            int(amt): PublicKey(bytes.fromhex(val), raw=True)
-            for amt, val in keys.items()
-        }
+        keyset_keys = await deserialize_pubkeys_async(keys)
         keyset = WalletKeyset(unit="sat", public_keys=keyset_keys, mint_url=url)
         return keyset
 
@@ -193,15 +179,12 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         logger.warning(f"Using deprecated API call: {url}/keys/{keyset_id}")
         keyset_id_urlsafe = keyset_id.replace("+", "-").replace("/", "_")
         resp = await self.httpx.get(
-            f"{url}/keys/{keyset_id_urlsafe}",
+            f"/keys/{keyset_id_urlsafe}",
         )
         self.raise_on_error(resp)
         keys = resp.json()
         assert len(keys), Exception("did not receive any keys")
-        keyset_keys = {
-            int(amt): PublicKey(bytes.fromhex(val), raw=True)
-            for amt, val in keys.items()
-        }
+        keyset_keys = await deserialize_pubkeys_async(keys, keyset_id)
         keyset = WalletKeyset(
             unit="sat",
             id=keyset_id,
@@ -225,15 +208,13 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         """
         logger.warning(f"Using deprecated API call: {url}/keysets")
         resp = await self.httpx.get(
-            f"{url}/keysets",
+            "/keysets",
         )
         self.raise_on_error(resp)
-        keysets_dict = resp.json()
-        keysets = KeysetsResponse_deprecated.parse_obj(keysets_dict)
-        assert len(keysets.keysets), Exception("did not receive any keysets")
+        keyset_ids: List[str] = resp.json()["keysets"]
+        assert len(keyset_ids), Exception("did not receive any keysets")
         keysets_new = [
-            KeysetsResponseKeyset(id=id, unit="sat", active=True)
-            for id in keysets.keysets
+            KeysetsResponseKeyset(id=id, unit="sat", active=True) for id in keyset_ids
         ]
         return keysets_new
 
@@ -252,14 +233,14 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
             Exception: If the mint request fails
         """
         logger.warning("Using deprecated API call: Requesting mint: GET /mint")
-        resp = await self.httpx.get(f"{self.url}/mint", params={"amount": amount})
+        resp = await self.httpx.get("/mint", params={"amount": amount})
         self.raise_on_error(resp)
         return_dict = resp.json()
-        mint_response = GetMintResponse_deprecated.parse_obj(return_dict)
-        decoded_invoice = bolt11.decode(mint_response.pr)
+        payment_request: str = return_dict["pr"]
+        decoded_invoice = bolt11.decode(payment_request)
         return PostMintQuoteResponse(
-            quote=mint_response.hash,
-            request=mint_response.pr,
+            quote=return_dict["hash"],
+            request=payment_request,
             paid=False,
             state=MintQuoteState.unpaid.value,
             expiry=decoded_invoice.date + (decoded_invoice.expiry or 0),
@@ -298,7 +279,7 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
             "Using deprecated API call:Checking Lightning invoice. POST /mint"
         )
         resp = await self.httpx.post(
-            f"{self.url}/mint",
+            "/mint",
             json=payload,
             params={
                 "hash": hash,
@@ -308,7 +289,7 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         self.raise_on_error(resp)
         response_dict = resp.json()
         logger.trace("Lightning invoice checked. POST /mint")
-        promises = PostMintResponse_deprecated.parse_obj(response_dict).promises
+        promises = [BlindedSignature(**p) for p in response_dict["promises"]]
         return promises
 
     @async_set_httpx_client
@@ -339,7 +320,7 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
             }
 
         resp = await self.httpx.post(
-            f"{self.url}/melt",
+            "/melt",
             json=payload.dict(include=_meltrequest_include_fields(proofs)),  # type: ignore
         )
         self.raise_on_error(resp)
@@ -377,13 +358,12 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
             }
 
         resp = await self.httpx.post(
-            join(self.url, "/split"),
+            "/split",
             json=split_payload.dict(include=_splitrequest_include_fields(proofs)),  # type: ignore
         )
         self.raise_on_error(resp)
         promises_dict = resp.json()
-        mint_response = PostSwapResponse_Deprecated.parse_obj(promises_dict)
-        promises = [BlindedSignature(**p.dict()) for p in mint_response.promises]
+        promises = [BlindedSignature(**p) for p in promises_dict["promises"]]
 
         if len(promises) == 0:
             raise Exception("received no splits.")
@@ -408,7 +388,7 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
             }
 
         resp = await self.httpx.post(
-            join(self.url, "/check"),
+            "/check",
             json=payload.dict(include=_check_proof_state_include_fields(proofs)),  # type: ignore
         )
         self.raise_on_error(resp)
@@ -428,7 +408,7 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         logger.warning("Using deprecated API call: POST /restore")
         outputs_deprecated = [BlindedMessage_Deprecated(**o.dict()) for o in outputs]
         payload = PostMintRequest_deprecated(outputs=outputs_deprecated)
-        resp = await self.httpx.post(join(self.url, "/restore"), json=payload.dict())
+        resp = await self.httpx.post("/restore", json=payload.dict())
         self.raise_on_error(resp)
         response_dict = resp.json()
         returnObj = PostRestoreResponse.parse_obj(response_dict)
@@ -447,7 +427,7 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         """Checks whether the Lightning payment is internal."""
         payload = CheckFeesRequest_deprecated(pr=payment_request)
         resp = await self.httpx.post(
-            join(self.url, "/checkfees"),
+            "/checkfees",
             json=payload.dict(),
         )
         self.raise_on_error(resp)
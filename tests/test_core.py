@@ -1,7 +1,8 @@
 import pytest
 
-from cashu.core.base import TokenV3, TokenV4, Unit
+from cashu.core.base import TOKEN_CACHE_MAX_LENGTH, TokenV3, TokenV4, Unit
 from cashu.core.helpers import calculate_number_of_blank_outputs
+from cashu.core.secret import Secret, SecretKind, Tags
 from cashu.core.split import amount_split
 from cashu.wallet.helpers import deserialize_token_from_string
 
@@ -51,6 +52,30 @@ def test_tokenv3_deserialize_with_memo():
     assert token.memo == "Test memo"
 
 
+def test_tokenv3_deserialize_returns_independent_copies():
+    token_str = "cashuAeyJ0b2tlbiI6W3sicHJvb2ZzIjpbeyJpZCI6IjAwYWQyNjhjNGQxZjU4MjYiLCJhbW91bnQiOjgsInNlY3JldCI6IjNlNDlhMGQzNzllMWQ1YTY3MjhiYzUwMjM4YTRjZDFlMjBiY2M5MjM4MjAxMDg0MzcyNjdhNWZkZDM2NWZiMDYiLCJDIjoiMDIyYWQwODg5ZmVkNWE0YWNjODEwYTZhZTk4MTc0YjFlZGM2OTkwMWI0OTdkNTYzYmM5NjEyMjVlYzMwOGVkMTVkIn0seyJpZCI6IjAwYWQyNjhjNGQxZjU4MjYiLCJhbW91bnQiOjIsInNlY3JldCI6ImNmNjhhNTQ3ZWY2ZDVhNGFkZTI0ZGM5MDU5ZTE5ZmJkZDU0NmQ5MGE1OWI0ODE5MzdmN2FjNmRiNWMwZjFkMTUiLCJDIjoiMDMyZWQ5ZGQ3MzExMTg1ODk1NTFiM2E5YjJhNTM5YWZlYTcxOTU3OGZhNTI1ZTVmMmJkY2M4YjNlMzhjNjJkOTRjIn1dLCJtaW50IjoiaHR0cDovL2xvY2FsaG9zdDozMzM4In1dLCJtZW1vIjoiVGVzdCBtZW1vIiwidW5pdCI6InNhdCJ9"
+    token_1 = TokenV3.deserialize(token_str)
+    token_1.proofs[0].witness = "modified"
+    token_1.unit = "msat"
+    token_2 = TokenV3.deserialize(token_str)
+    assert token_2.proofs[0].witness is None
+    assert token_2.unit == "sat"
+    assert token_2.serialize() == token_str
+
+
+def test_tokenv3_deserialize_large_token_not_cached():
+    token_str = "cashuAeyJ0b2tlbiI6W3sicHJvb2ZzIjpbeyJpZCI6IjAwYWQyNjhjNGQxZjU4MjYiLCJhbW91bnQiOjgsInNlY3JldCI6IjNlNDlhMGQzNzllMWQ1YTY3MjhiYzUwMjM4YTRjZDFlMjBiY2M5MjM4MjAxMDg0MzcyNjdhNWZkZDM2NWZiMDYiLCJDIjoiMDIyYWQwODg5ZmVkNWE0YWNjODEwYTZhZTk4MTc0YjFlZGM2OTkwMWI0OTdkNTYzYmM5NjEyMjVlYzMwOGVkMTVkIn0seyJpZCI6IjAwYWQyNjhjNGQxZjU4MjYiLCJhbW91bnQiOjIsInNlY3JldCI6ImNmNjhhNTQ3ZWY2ZDVhNGFkZTI0ZGM5MDU5ZTE5ZmJkZDU0NmQ5MGE1OWI0ODE5MzdmN2FjNmRiNWMwZjFkMTUiLCJDIjoiMDMyZWQ5ZGQ3MzExMTg1ODk1NTFiM2E5YjJhNTM5YWZlYTcxOTU3OGZhNTI1ZTVmMmJkY2M4YjNlMzhjNjJkOTRjIn1dLCJtaW50IjoiaHR0cDovL2xvY2FsaG9zdDozMzM4In1dLCJtZW1vIjoiVGVzdCBtZW1vIiwidW5pdCI6InNhdCJ9"
+    token = TokenV3.deserialize(token_str)
+    token.token[0].proofs *= 20
+    large_token_str = token.serialize()
+    assert len(large_token_str) > TOKEN_CACHE_MAX_LENGTH
+
+    cache_size = TokenV3._deserialize_cached.cache_info().currsize
+    large_token = TokenV3.deserialize(large_token_str)
+    assert len(large_token.proofs) == 40
+    assert TokenV3._deserialize_cached.cache_info().currsize == cache_size
+
+
 def test_tokenv3_serialize_example_token_nut00():
     token_dict = {
         "token": [
@@ -262,3 +287,9 @@ def test_parse_token_v3_v4_base64_keyset_id():
     # this token can not be serialized to V4
     token = deserialize_token_from_string(token_v3_base64_keyset_serialized)
     assert isinstance(token, TokenV3)
+
+
+def test_secret_peek_kind():
+    secret = Secret(kind=SecretKind.P2PK.value, data="02" + "ab" * 32, tags=Tags())
+    assert Secret.peek_kind(secret.serialize()) == SecretKind.P2PK.value
+    assert Secret.peek_kind("c5e0e4ec3e3f6d1c2c4b1e8e0d1b0bd1ea4e2bd6b2d3b0b1") is None
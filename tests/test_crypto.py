@@ -11,6 +11,7 @@ from cashu.core.crypto.b_dhke import (
     step2_bob_dleq,
     step3_alice,
 )
+from cashu.core.crypto.keys import deserialize_pubkeys
 from cashu.core.crypto.secp import PrivateKey, PublicKey
 
 
@@ -492,3 +493,31 @@ def test_dleq_step2_bob_dleq_deprecated():
         s.serialize()
         == "828404170c86f240c50ae0f5fc17bb6b82612d46b355e046d7cd84b0a3c934a0"
     )
+
+
+def test_deserialize_pubkeys():
+    pubkeys = {
+        amount: PrivateKey(
+            privkey=amount.to_bytes(32, "big"),
+            raw=True,
+        ).pubkey
+        for amount in [1, 2, 4, 8]
+    }
+    serialized = {str(k): v.serialize().hex() for k, v in pubkeys.items()}
+    keys = deserialize_pubkeys(serialized)
+    assert list(keys.keys()) == [1, 2, 4, 8]
+    assert {k: v.serialize().hex() for k, v in keys.items()} == {
+        int(k): v for k, v in serialized.items()
+    }
+    # without a keyset id, keys are parsed again
+    assert deserialize_pubkeys(serialized)[1] is not keys[1]
+
+    # parsed keys are reused when the same keyset is loaded again
+    keys = deserialize_pubkeys(serialized, keyset_id="00test")
+    keys_again = deserialize_pubkeys(serialized, keyset_id="00test")
+    assert keys_again is not keys
+    assert all(keys_again[k] is keys[k] for k in keys)
+
+    # different keys under a cached keyset id are parsed and not taken from the cache
+    other_keys = deserialize_pubkeys({"1": serialized["2"]}, keyset_id="00test")
+    assert other_keys[1].serialize().hex() == serialized["2"]
@@ -2,7 +2,7 @@ from typing import List
 
 import pytest
 
-from cashu.core.base import BlindedMessage, MintKeyset, Proof, Unit
+from cashu.core.base import BlindedMessage, Proof, Unit
 from cashu.core.crypto.b_dhke import step1_alice
 from cashu.core.helpers import calculate_number_of_blank_outputs
 from cashu.core.models import PostMintQuoteRequest
@@ -218,10 +218,7 @@ async def test_generate_change_promises_returns_empty_if_no_outputs(ledger: Ledg
 
 @pytest.mark.asyncio
 async def test_get_balance(ledger: Ledger):
-    unit = Unit["sat"]
-    active_keyset: MintKeyset = next(
-        filter(lambda k: k.active and k.unit == unit, ledger.keysets.values())
-    )
+    active_keyset = ledger.get_active_keyset(Unit["sat"])
     balance = await ledger.get_balance(active_keyset)
     assert balance == 0
 
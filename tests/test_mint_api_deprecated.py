@@ -1,6 +1,7 @@
+import asyncio
+
 import httpx
 import pytest
-import pytest_asyncio
 
 from cashu.core.base import Proof, Unit
 from cashu.core.models import (
@@ -18,7 +19,7 @@ from tests.helpers import get_real_invoice, is_fake, is_regtest, pay_if_regtest
 BASE_URL = "http://localhost:3337"
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest.fixture(scope="function")
 async def wallet(ledger: Ledger):
     wallet1 = await Wallet.with_db(
         url=BASE_URL,
@@ -29,17 +30,21 @@ async def wallet(ledger: Ledger):
     yield wallet1
 
 
-@pytest.mark.asyncio
-async def test_info(ledger: Ledger):
-    response = httpx.get(f"{BASE_URL}/info")
+@pytest.fixture(scope="function")
+async def client():
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=None) as client:
+        yield client
+
+
+async def test_info(ledger: Ledger, client: httpx.AsyncClient):
+    response = await client.get("/info")
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     assert ledger.pubkey
     assert response.json()["pubkey"] == ledger.pubkey.serialize().hex()
 
 
-@pytest.mark.asyncio
-async def test_api_keys(ledger: Ledger):
-    response = httpx.get(f"{BASE_URL}/keys")
+async def test_api_keys(ledger: Ledger, client: httpx.AsyncClient):
+    response = await client.get("/keys")
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     assert ledger.keyset.public_keys
     assert response.json() == {
@@ -47,18 +52,16 @@ async def test_api_keys(ledger: Ledger):
     }
 
 
-@pytest.mark.asyncio
-async def test_api_keysets(ledger: Ledger):
-    response = httpx.get(f"{BASE_URL}/keysets")
+async def test_api_keysets(ledger: Ledger, client: httpx.AsyncClient):
+    response = await client.get("/keysets")
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     assert ledger.keyset.public_keys
     sat_keysets = {k: v for k, v in ledger.keysets.items() if v.unit == Unit.sat}
     assert response.json()["keysets"] == list(sat_keysets.keys())
 
 
-@pytest.mark.asyncio
-async def test_api_keyset_keys(ledger: Ledger):
-    response = httpx.get(f"{BASE_URL}/keys/009a1f293253e41e")
+async def test_api_keyset_keys(ledger: Ledger, client: httpx.AsyncClient):
+    response = await client.get("/keys/009a1f293253e41e")
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     assert ledger.keyset.public_keys
     assert response.json() == {
@@ -66,8 +69,7 @@ async def test_api_keyset_keys(ledger: Ledger):
     }
 
 
-@pytest.mark.asyncio
-async def test_split(ledger: Ledger, wallet: Wallet):
+async def test_split(ledger: Ledger, wallet: Wallet, client: httpx.AsyncClient):
     mint_quote = await wallet.request_mint(64)
     await pay_if_regtest(mint_quote.request)
     await wallet.mint(64, quote_id=mint_quote.quote)
@@ -81,14 +83,15 @@ async def test_split(ledger: Ledger, wallet: Wallet):
     for o in outputs_payload:
         o.pop("id")
     payload = {"proofs": inputs_payload, "outputs": outputs_payload}
-    response = httpx.post(f"{BASE_URL}/split", json=payload, timeout=None)
+    response = await client.post("/split", json=payload)
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     result = response.json()
     assert result["promises"]
 
 
-@pytest.mark.asyncio
-async def test_split_deprecated_with_amount(ledger: Ledger, wallet: Wallet):
+async def test_split_deprecated_with_amount(
+    ledger: Ledger, wallet: Wallet, client: httpx.AsyncClient
+):
     mint_quote = await wallet.request_mint(64)
     await pay_if_regtest(mint_quote.request)
     await wallet.mint(64, quote_id=mint_quote.quote)
@@ -103,7 +106,7 @@ async def test_split_deprecated_with_amount(ledger: Ledger, wallet: Wallet):
         o.pop("id")
     # we supply an amount here, which should cause the very old deprecated split endpoint to be used
     payload = {"proofs": inputs_payload, "outputs": outputs_payload, "amount": 32}
-    response = httpx.post(f"{BASE_URL}/split", json=payload, timeout=None)
+    response = await client.post("/split", json=payload)
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     result = response.json()
     # old deprecated output format
@@ -111,35 +114,34 @@ async def test_split_deprecated_with_amount(ledger: Ledger, wallet: Wallet):
     assert result["snd"]
 
 
-@pytest.mark.asyncio
-async def test_api_mint_validation(ledger):
-    response = httpx.get(f"{BASE_URL}/mint?amount=-21")
-    assert "detail" in response.json()
-    response = httpx.get(f"{BASE_URL}/mint?amount=0")
-    assert "detail" in response.json()
-    response = httpx.get(f"{BASE_URL}/mint?amount=2100000000000001")
-    assert "detail" in response.json()
-    response = httpx.get(f"{BASE_URL}/mint?amount=1")
-    assert "detail" not in response.json()
+async def test_api_mint_validation(ledger, client: httpx.AsyncClient):
+    # the requests are independent, send them concurrently
+    responses = await asyncio.gather(
+        client.get("/mint?amount=-21"),
+        client.get("/mint?amount=0"),
+        client.get("/mint?amount=2100000000000001"),
+        client.get("/mint?amount=1"),
+    )
+    assert "detail" in responses[0].json()
+    assert "detail" in responses[1].json()
+    assert "detail" in responses[2].json()
+    assert "detail" not in responses[3].json()
 
 
-@pytest.mark.asyncio
-async def test_mint(ledger: Ledger, wallet: Wallet):
-    quote_response = httpx.get(
-        f"{BASE_URL}/mint",
+async def test_mint(ledger: Ledger, wallet: Wallet, client: httpx.AsyncClient):
+    quote_response = await client.get(
+        "/mint",
         params={"amount": 64},
-        timeout=None,
     )
     mint_quote = GetMintResponse_deprecated.parse_obj(quote_response.json())
     await pay_if_regtest(mint_quote.pr)
     secrets, rs, derivation_paths = await wallet.generate_secrets_from_to(10000, 10001)
     outputs, rs = wallet._construct_outputs([32, 32], secrets, rs)
     outputs_payload = [o.dict() for o in outputs]
-    response = httpx.post(
-        f"{BASE_URL}/mint",
+    response = await client.post(
+        "/mint",
         json={"outputs": outputs_payload},
         params={"hash": mint_quote.hash},
-        timeout=None,
     )
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     result = response.json()
@@ -152,8 +154,7 @@ async def test_mint(ledger: Ledger, wallet: Wallet):
     assert "s" in result["promises"][0]["dleq"]
 
 
-@pytest.mark.asyncio
-async def test_melt_internal(ledger: Ledger, wallet: Wallet):
+async def test_melt_internal(ledger: Ledger, wallet: Wallet, client: httpx.AsyncClient):
     # fill wallet
     mint_quote = await wallet.request_mint(64)
     await pay_if_regtest(mint_quote.request)
@@ -176,14 +177,13 @@ async def test_melt_internal(ledger: Ledger, wallet: Wallet):
     outputs, rs = wallet._construct_outputs([2], secrets, rs)
     outputs_payload = [o.dict() for o in outputs]
 
-    response = httpx.post(
-        f"{BASE_URL}/melt",
+    response = await client.post(
+        "/melt",
         json={
             "pr": invoice_payment_request,
             "proofs": inputs_payload,
             "outputs": outputs_payload,
         },
-        timeout=None,
     )
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     result = response.json()
@@ -191,8 +191,9 @@ async def test_melt_internal(ledger: Ledger, wallet: Wallet):
     assert result["paid"] is True
 
 
-@pytest.mark.asyncio
-async def test_melt_internal_no_change_outputs(ledger: Ledger, wallet: Wallet):
+async def test_melt_internal_no_change_outputs(
+    ledger: Ledger, wallet: Wallet, client: httpx.AsyncClient
+):
     # Clients without NUT-08 will not send change outputs
     # internal invoice
     mint_quote = await wallet.request_mint(64)
@@ -213,13 +214,12 @@ async def test_melt_internal_no_change_outputs(ledger: Ledger, wallet: Wallet):
     secrets, rs, derivation_paths = await wallet.generate_n_secrets(1)
     outputs, rs = wallet._construct_outputs([2], secrets, rs)
 
-    response = httpx.post(
-        f"{BASE_URL}/melt",
+    response = await client.post(
+        "/melt",
         json={
             "pr": invoice_payment_request,
             "proofs": inputs_payload,
         },
-        timeout=None,
     )
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     result = response.json()
@@ -227,12 +227,11 @@ async def test_melt_internal_no_change_outputs(ledger: Ledger, wallet: Wallet):
     assert result["paid"] is True
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(
     is_fake,
     reason="only works on regtest",
 )
-async def test_melt_external(ledger: Ledger, wallet: Wallet):
+async def test_melt_external(ledger: Ledger, wallet: Wallet, client: httpx.AsyncClient):
     # internal invoice
     mint_quote = await wallet.request_mint(64)
     await pay_if_regtest(mint_quote.request)
@@ -255,14 +254,13 @@ async def test_melt_external(ledger: Ledger, wallet: Wallet):
     outputs, rs = wallet._construct_outputs([2], secrets, rs)
     outputs_payload = [o.dict() for o in outputs]
 
-    response = httpx.post(
-        f"{BASE_URL}/melt",
+    response = await client.post(
+        "/melt",
         json={
             "pr": invoice_payment_request,
             "proofs": inputs_payload,
             "outputs": outputs_payload,
         },
-        timeout=None,
     )
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     result = response.json()
@@ -273,16 +271,14 @@ async def test_melt_external(ledger: Ledger, wallet: Wallet):
     assert result["change"][0]["amount"] == 2
 
 
-@pytest.mark.asyncio
-async def test_checkfees(ledger: Ledger, wallet: Wallet):
+async def test_checkfees(ledger: Ledger, wallet: Wallet, client: httpx.AsyncClient):
     # internal invoice
     mint_quote = await wallet.request_mint(64)
-    response = httpx.post(
-        f"{BASE_URL}/checkfees",
+    response = await client.post(
+        "/checkfees",
         json={
             "pr": mint_quote.request,
         },
-        timeout=None,
     )
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     result = response.json()
@@ -290,16 +286,14 @@ async def test_checkfees(ledger: Ledger, wallet: Wallet):
     assert result["fee"] == 0
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(not is_regtest, reason="only works on regtest")
-async def test_checkfees_external(ledger: Ledger, wallet: Wallet):
+async def test_checkfees_external(client: httpx.AsyncClient):
     # external invoice
     invoice_dict = get_real_invoice(62)
     invoice_payment_request = invoice_dict["payment_request"]
-    response = httpx.post(
-        f"{BASE_URL}/checkfees",
+    response = await client.post(
+        "/checkfees",
         json={"pr": invoice_payment_request},
-        timeout=None,
     )
     assert response.status_code == 200, f"{response.url} {response.status_code}"
     result = response.json()
@@ -307,15 +301,14 @@ async def test_checkfees_external(ledger: Ledger, wallet: Wallet):
     assert result["fee"] == 2
 
 
-@pytest.mark.asyncio
-async def test_api_check_state(ledger: Ledger):
+async def test_api_check_state(ledger: Ledger, client: httpx.AsyncClient):
     proofs = [
         Proof(id="1234", amount=0, secret="asdasdasd", C="asdasdasd"),
         Proof(id="1234", amount=0, secret="asdasdasd1", C="asdasdasd1"),
     ]
     payload = CheckSpendableRequest_deprecated(proofs=proofs)
-    response = httpx.post(
-        f"{BASE_URL}/check",
+    response = await client.post(
+        "/check",
         json=payload.dict(),
     )
     assert response.status_code == 200, f"{response.url} {response.status_code}"
@@ -326,8 +319,7 @@ async def test_api_check_state(ledger: Ledger):
     assert len(states.pending) == 2
 
 
-@pytest.mark.asyncio
-async def test_api_restore(ledger: Ledger, wallet: Wallet):
+async def test_api_restore(ledger: Ledger, wallet: Wallet, client: httpx.AsyncClient):
     mint_quote = await wallet.request_mint(64)
     await pay_if_regtest(mint_quote.request)
     await wallet.mint(64, quote_id=mint_quote.quote)
@@ -341,8 +333,8 @@ async def test_api_restore(ledger: Ledger, wallet: Wallet):
     outputs, rs = wallet._construct_outputs([64], secrets, rs)
 
     payload = PostRestoreRequest(outputs=outputs)
-    response = httpx.post(
-        f"{BASE_URL}/restore",
+    response = await client.post(
+        "/restore",
         json=payload.dict(),
     )
     data = response.json()
@@ -1,5 +1,7 @@
+import asyncio
+from unittest.mock import patch
+
 import pytest
-import pytest_asyncio
 
 from cashu.core.base import MeltQuoteState
 from cashu.core.helpers import sum_proofs
@@ -24,7 +26,7 @@ async def assert_err(f, msg):
     raise Exception(f"Expected error: {msg}, got no error")
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest.fixture(scope="function")
 async def wallet1(ledger: Ledger):
     wallet1 = await Wallet1.with_db(
         url=SERVER_ENDPOINT,
@@ -35,7 +37,6 @@ async def wallet1(ledger: Ledger):
     yield wallet1
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(is_regtest, reason="only works with FakeWallet")
 async def test_melt_internal(wallet1: Wallet, ledger: Ledger):
     # mint twice so we have enough to pay the second invoice back
@@ -76,7 +77,6 @@ async def test_melt_internal(wallet1: Wallet, ledger: Ledger):
     assert melt_quote_post_payment.paid
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(is_fake, reason="only works with Regtest")
 async def test_melt_external(wallet1: Wallet, ledger: Ledger):
     # mint twice so we have enough to pay the second invoice back
@@ -88,15 +88,18 @@ async def test_melt_external(wallet1: Wallet, ledger: Ledger):
     invoice_dict = get_real_invoice(64)
     invoice_payment_request = invoice_dict["payment_request"]
 
-    mint_quote = await wallet1.melt_quote(invoice_payment_request)
+    # the wallet and the ledger quote the same invoice independently
+    mint_quote, melt_quote = await asyncio.gather(
+        wallet1.melt_quote(invoice_payment_request),
+        ledger.melt_quote(
+            PostMeltQuoteRequest(request=invoice_payment_request, unit="sat")
+        ),
+    )
     assert not mint_quote.paid, "mint quote should not be paid"
     assert mint_quote.state == MeltQuoteState.unpaid.value
 
     total_amount = mint_quote.amount + mint_quote.fee_reserve
     keep_proofs, send_proofs = await wallet1.swap_to_send(wallet1.proofs, total_amount)
-    melt_quote = await ledger.melt_quote(
-        PostMeltQuoteRequest(request=invoice_payment_request, unit="sat")
-    )
 
     if not settings.debug_mint_only_deprecated:
         melt_quote_response_pre_payment = await wallet1.get_melt_quote(melt_quote.quote)
@@ -117,7 +120,6 @@ async def test_melt_external(wallet1: Wallet, ledger: Ledger):
     assert melt_quote_post_payment.paid
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(is_regtest, reason="only works with FakeWallet")
 async def test_mint_internal(wallet1: Wallet, ledger: Ledger):
     wallet_mint_quote = await wallet1.request_mint(128)
@@ -153,7 +155,6 @@ async def test_mint_internal(wallet1: Wallet, ledger: Ledger):
     assert mint_quote_after_payment.issued
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(is_fake, reason="only works with Regtest")
 async def test_mint_external(wallet1: Wallet, ledger: Ledger):
     quote = await wallet1.request_mint(128)
@@ -190,7 +191,6 @@ async def test_mint_external(wallet1: Wallet, ledger: Ledger):
     assert mint_quote_after_payment.issued, "mint quote should be issued"
 
 
-@pytest.mark.asyncio
 async def test_split(wallet1: Wallet, ledger: Ledger):
     mint_quote = await wallet1.request_mint(64)
     await pay_if_regtest(mint_quote.request)
@@ -207,7 +207,6 @@ async def test_split(wallet1: Wallet, ledger: Ledger):
     assert [p.amount for p in promises] == [p.amount for p in outputs]
 
 
-@pytest.mark.asyncio
 async def test_split_with_no_outputs(wallet1: Wallet, ledger: Ledger):
     mint_quote = await wallet1.request_mint(64)
     await pay_if_regtest(mint_quote.request)
@@ -219,7 +218,6 @@ async def test_split_with_no_outputs(wallet1: Wallet, ledger: Ledger):
     )
 
 
-@pytest.mark.asyncio
 async def test_split_with_input_less_than_outputs(wallet1: Wallet, ledger: Ledger):
     mint_quote = await wallet1.request_mint(64)
     await pay_if_regtest(mint_quote.request)
@@ -248,7 +246,6 @@ async def test_split_with_input_less_than_outputs(wallet1: Wallet, ledger: Ledge
     keep_proofs, send_proofs = await wallet1.split(wallet1.proofs, 10)
 
 
-@pytest.mark.asyncio
 async def test_split_with_input_more_than_outputs(wallet1: Wallet, ledger: Ledger):
     mint_quote = await wallet1.request_mint(128)
     await pay_if_regtest(mint_quote.request)
@@ -272,7 +269,6 @@ async def test_split_with_input_more_than_outputs(wallet1: Wallet, ledger: Ledge
     keep_proofs, send_proofs = await wallet1.split(inputs, 10)
 
 
-@pytest.mark.asyncio
 async def test_split_twice_with_same_outputs(wallet1: Wallet, ledger: Ledger):
     mint_quote = await wallet1.request_mint(128)
     await pay_if_regtest(mint_quote.request)
@@ -307,7 +303,6 @@ async def test_split_twice_with_same_outputs(wallet1: Wallet, ledger: Ledger):
     await ledger.swap(proofs=inputs2, outputs=outputs)
 
 
-@pytest.mark.asyncio
 async def test_mint_with_same_outputs_twice(wallet1: Wallet, ledger: Ledger):
     mint_quote = await wallet1.request_mint(128)
     await pay_if_regtest(mint_quote.request)
@@ -332,7 +327,6 @@ async def test_mint_with_same_outputs_twice(wallet1: Wallet, ledger: Ledger):
     )
 
 
-@pytest.mark.asyncio
 async def test_melt_with_same_outputs_twice(wallet1: Wallet, ledger: Ledger):
     mint_quote = await wallet1.request_mint(130)
     await pay_if_regtest(mint_quote.request)
@@ -362,7 +356,6 @@ async def test_melt_with_same_outputs_twice(wallet1: Wallet, ledger: Ledger):
     )
 
 
-@pytest.mark.asyncio
 async def test_melt_with_less_inputs_than_invoice(wallet1: Wallet, ledger: Ledger):
     mint_quote = await wallet1.request_mint(32)
     await pay_if_regtest(mint_quote.request)
@@ -391,7 +384,6 @@ async def test_melt_with_less_inputs_than_invoice(wallet1: Wallet, ledger: Ledge
     )
 
 
-@pytest.mark.asyncio
 async def test_melt_with_more_inputs_than_invoice(wallet1: Wallet, ledger: Ledger):
     mint_quote = await wallet1.request_mint(130)
     await pay_if_regtest(mint_quote.request)
@@ -423,7 +415,6 @@ async def test_melt_with_more_inputs_than_invoice(wallet1: Wallet, ledger: Ledge
     assert sum([o.amount for o in melt_resp.change]) == 2
 
 
-@pytest.mark.asyncio
 async def test_check_proof_state(wallet1: Wallet, ledger: Ledger):
     mint_quote = await wallet1.request_mint(64)
     await pay_if_regtest(mint_quote.request)
@@ -435,8 +426,28 @@ async def test_check_proof_state(wallet1: Wallet, ledger: Ledger):
     assert all([p.state.value == "UNSPENT" for p in proof_states])
 
 
+async def test_check_proof_state_batched(wallet1: Wallet, ledger: Ledger):
+    mint_quote = await wallet1.request_mint(64)
+    await pay_if_regtest(mint_quote.request)
+    await wallet1.mint(64, split=[1] * 64, quote_id=mint_quote.quote)
+    assert len(wallet1.proofs) == 64
+
+    # the states of all proofs are looked up with one query per table
+    with patch.object(
+        ledger.crud, "get_proofs_used", wraps=ledger.crud.get_proofs_used
+    ) as get_proofs_used, patch.object(
+        ledger.crud, "get_proofs_pending", wraps=ledger.crud.get_proofs_pending
+    ) as get_proofs_pending:
+        proof_states = await ledger.db_read.get_proofs_states(
+            Ys=[p.Y for p in wallet1.proofs]
+        )
+    get_proofs_used.assert_called_once()
+    get_proofs_pending.assert_called_once()
+    assert len(proof_states) == 64
+    assert all([p.state.value == "UNSPENT" for p in proof_states])
+
+
 # TODO: test keeps running forever, needs to be fixed
-# @pytest.mark.asyncio
 # async def test_websocket_quote_updates(wallet1: Wallet, ledger: Ledger):
 #     mint_quote = await wallet1.request_mint(64)
 #     ws = websocket.create_connection(
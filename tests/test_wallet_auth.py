@@ -1,7 +1,7 @@
+import asyncio
 import hashlib
 import os
-import shutil
-from pathlib import Path
+from typing import Tuple
 
 import pytest
 import pytest_asyncio
@@ -21,25 +21,58 @@ from tests.conftest import SERVER_ENDPOINT
 from tests.helpers import assert_err
 
 
-@pytest_asyncio.fixture(scope="function")
-async def wallet():
-    dirpath = Path("test_data/wallet")
-    if dirpath.exists() and dirpath.is_dir():
-        shutil.rmtree(dirpath)
+@pytest.fixture(scope="function")
+async def wallet(tmp_path):
     wallet = await Wallet.with_db(
         url=SERVER_ENDPOINT,
-        db="test_data/wallet",
+        db=str(tmp_path / "wallet"),
         name="wallet",
     )
     await wallet.load_mint()
     yield wallet
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def oidc_tokens(tmp_path_factory) -> Tuple[str, str]:
+    """Access and refresh token of the test user. The password grant is done once
+    for all tests of this module."""
+    auth_wallet = await WalletAuth.with_db(
+        url=SERVER_ENDPOINT,
+        db=str(tmp_path_factory.mktemp("oidc")),
+        username="asd@asd.com",
+        password="asdasd",
+    )
+    requires_auth = await auth_wallet.init_auth_wallet(mint_auth_proofs=False)
+    assert requires_auth
+    access_token = auth_wallet.oidc_client.access_token
+    refresh_token = auth_wallet.oidc_client.refresh_token
+    assert access_token and refresh_token
+    return access_token, refresh_token
+
+
+@pytest.fixture(scope="function")
+async def auth_wallet(wallet: Wallet, oidc_tokens: Tuple[str, str]):
+    """Auth wallet without auth proofs, authenticated with the module's tokens."""
+    access_token, refresh_token = oidc_tokens
+    auth_wallet = await WalletAuth.with_db(
+        url=wallet.url,
+        db=wallet.db.db_location,
+        username="asd@asd.com",
+        password="asdasd",
+        access_token=access_token,
+        refresh_token=refresh_token,
+    )
+    requires_auth = await auth_wallet.init_auth_wallet(
+        wallet.mint_info, mint_auth_proofs=False
+    )
+    assert requires_auth
+    yield auth_wallet
+
+
 @pytest.mark.skipif(
     not settings.mint_require_auth,
     reason="settings.mint_require_auth is False",
 )
-@pytest.mark.asyncio
 async def test_wallet_auth_password(wallet: Wallet):
     auth_wallet = await WalletAuth.with_db(
         url=wallet.url,
@@ -63,7 +96,6 @@ async def test_wallet_auth_password(wallet: Wallet):
     not settings.mint_require_auth,
     reason="settings.mint_require_auth is False",
 )
-@pytest.mark.asyncio
 async def test_wallet_auth_wrong_password(wallet: Wallet):
     auth_wallet = await WalletAuth.with_db(
         url=wallet.url,
@@ -79,18 +111,8 @@ async def test_wallet_auth_wrong_password(wallet: Wallet):
     not settings.mint_require_auth,
     reason="settings.mint_require_auth is False",
 )
-@pytest.mark.asyncio
-async def test_wallet_auth_mint(wallet: Wallet):
-    auth_wallet = await WalletAuth.with_db(
-        url=wallet.url,
-        db=wallet.db.db_location,
-        username="asd@asd.com",
-        password="asdasd",
-    )
-
-    requires_auth = await auth_wallet.init_auth_wallet(wallet.mint_info)
-    assert requires_auth
-
+async def test_wallet_auth_mint(auth_wallet: WalletAuth):
+    await auth_wallet.mint_blind_auth_min_balance()
     await auth_wallet.load_proofs()
     assert len(auth_wallet.proofs) == auth_wallet.mint_info.bat_max_mint
 
@@ -99,19 +121,7 @@ async def test_wallet_auth_mint(wallet: Wallet):
     not settings.mint_require_auth,
     reason="settings.mint_require_auth is False",
 )
-@pytest.mark.asyncio
-async def test_wallet_auth_mint_manually(wallet: Wallet):
-    auth_wallet = await WalletAuth.with_db(
-        url=wallet.url,
-        db=wallet.db.db_location,
-        username="asd@asd.com",
-        password="asdasd",
-    )
-
-    requires_auth = await auth_wallet.init_auth_wallet(
-        wallet.mint_info, mint_auth_proofs=False
-    )
-    assert requires_auth
+async def test_wallet_auth_mint_manually(auth_wallet: WalletAuth):
     assert len(auth_wallet.proofs) == 0
 
     await auth_wallet.mint_blind_auth()
@@ -122,19 +132,7 @@ async def test_wallet_auth_mint_manually(wallet: Wallet):
     not settings.mint_require_auth,
     reason="settings.mint_require_auth is False",
 )
-@pytest.mark.asyncio
-async def test_wallet_auth_mint_manually_invalid_cat(wallet: Wallet):
-    auth_wallet = await WalletAuth.with_db(
-        url=wallet.url,
-        db=wallet.db.db_location,
-        username="asd@asd.com",
-        password="asdasd",
-    )
-
-    requires_auth = await auth_wallet.init_auth_wallet(
-        wallet.mint_info, mint_auth_proofs=False
-    )
-    assert requires_auth
+async def test_wallet_auth_mint_manually_invalid_cat(auth_wallet: WalletAuth):
     assert len(auth_wallet.proofs) == 0
 
     # invalidate CAT in the database
@@ -161,20 +159,11 @@ async def test_wallet_auth_mint_manually_invalid_cat(wallet: Wallet):
     not settings.mint_require_auth,
     reason="settings.mint_require_auth is False",
 )
-@pytest.mark.asyncio
-async def test_wallet_auth_invoice(wallet: Wallet):
+async def test_wallet_auth_invoice(wallet: Wallet, auth_wallet: WalletAuth):
     # should fail, wallet error
     await assert_err(wallet.mint_quote(10, Unit.sat), "Mint requires blind auth")
 
-    auth_wallet = await WalletAuth.with_db(
-        url=wallet.url,
-        db=wallet.db.db_location,
-        username="asd@asd.com",
-        password="asdasd",
-    )
-    requires_auth = await auth_wallet.init_auth_wallet(wallet.mint_info)
-    assert requires_auth
-
+    await auth_wallet.mint_blind_auth_min_balance()
     await auth_wallet.load_proofs()
     assert len(auth_wallet.proofs) == auth_wallet.mint_info.bat_max_mint
 
@@ -189,20 +178,11 @@ async def test_wallet_auth_invoice(wallet: Wallet):
     not settings.mint_require_auth,
     reason="settings.mint_require_auth is False",
 )
-@pytest.mark.asyncio
-async def test_wallet_auth_invoice_invalid_bat(wallet: Wallet):
+async def test_wallet_auth_invoice_invalid_bat(wallet: Wallet, auth_wallet: WalletAuth):
     # should fail, wallet error
     await assert_err(wallet.mint_quote(10, Unit.sat), "Mint requires blind auth")
 
-    auth_wallet = await WalletAuth.with_db(
-        url=wallet.url,
-        db=wallet.db.db_location,
-        username="asd@asd.com",
-        password="asdasd",
-    )
-    requires_auth = await auth_wallet.init_auth_wallet(wallet.mint_info)
-    assert requires_auth
-
+    await auth_wallet.mint_blind_auth_min_balance()
     await auth_wallet.load_proofs()
     assert len(auth_wallet.proofs) == auth_wallet.mint_info.bat_max_mint
 
@@ -223,29 +203,16 @@ async def test_wallet_auth_invoice_invalid_bat(wallet: Wallet):
     not settings.mint_require_auth,
     reason="settings.mint_require_auth is False",
 )
-@pytest.mark.asyncio
-async def test_wallet_auth_rate_limit(wallet: Wallet):
-    auth_wallet = await WalletAuth.with_db(
-        url=wallet.url,
-        db=wallet.db.db_location,
-        username="asd@asd.com",
-        password="asdasd",
-    )
-    requires_auth = await auth_wallet.init_auth_wallet(
-        wallet.mint_info, mint_auth_proofs=False
-    )
-    assert requires_auth
-
-    errored = False
-    for _ in range(100):
-        try:
-            await auth_wallet.mint_blind_auth()
-        except Exception as e:
-            assert BlindAuthRateLimitExceededError.detail in str(e)
-            errored = True
-            break
+async def test_wallet_auth_rate_limit(auth_wallet: WalletAuth):
+    # mint once so that the mint has created the user before the concurrent requests
+    await auth_wallet.mint_blind_auth()
 
-    assert errored
+    # fire all requests at once, the mint should start rejecting them
+    results = await asyncio.gather(
+        *[auth_wallet.mint_blind_auth() for _ in range(100)], return_exceptions=True
+    )
+    errors = [r for r in results if isinstance(r, Exception)]
+    assert any(BlindAuthRateLimitExceededError.detail in str(e) for e in errors)
 
     # should have minted at least twice
     assert len(auth_wallet.proofs) > auth_wallet.mint_info.bat_max_mint
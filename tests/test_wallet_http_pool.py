@@ -0,0 +1,59 @@
+import asyncio
+
+import httpx
+
+from cashu.wallet import http_pool
+from cashu.wallet.http_pool import close_httpx_clients, get_httpx_client
+from tests.conftest import SERVER_ENDPOINT
+
+
+async def test_client_reused_for_same_mint():
+    client = get_httpx_client(SERVER_ENDPOINT)
+    assert get_httpx_client(SERVER_ENDPOINT) is client
+    assert get_httpx_client(SERVER_ENDPOINT, "socks5://localhost:9050") is not client
+    assert get_httpx_client(f"{SERVER_ENDPOINT}/other") is not client
+
+
+def test_client_per_event_loop():
+    async def get_client():
+        return get_httpx_client(SERVER_ENDPOINT)
+
+    assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+
+def test_clients_of_closed_loops_are_dropped():
+    async def request():
+        client = get_httpx_client(SERVER_ENDPOINT)
+        resp = await client.get("/v1/info")
+        assert resp.status_code == 200
+
+    for _ in range(20):
+        asyncio.run(request())
+
+    async def count_loops():
+        get_httpx_client(SERVER_ENDPOINT)
+        return len(http_pool._clients)
+
+    assert asyncio.run(count_loops()) == 1
+
+
+async def test_client_recreated_after_close():
+    client = get_httpx_client(SERVER_ENDPOINT)
+    await client.aclose()
+    new_client = get_httpx_client(SERVER_ENDPOINT)
+    assert new_client is not client
+    assert not new_client.is_closed
+
+    await close_httpx_clients()
+    assert new_client.is_closed
+
+
+async def test_client_rejects_cookies():
+    client = get_httpx_client(SERVER_ENDPOINT)
+    response = httpx.Response(
+        200,
+        headers={"Set-Cookie": "session=abc; Path=/"},
+        request=httpx.Request("GET", f"{SERVER_ENDPOINT}/v1/info"),
+    )
+    client.cookies.extract_cookies(response)
+    assert len(client.cookies) == 0
@@ -8,6 +8,7 @@ import pytest_asyncio
 from cashu.core.base import Proof
 from cashu.core.crypto.secp import PrivateKey
 from cashu.core.errors import CashuError
+from cashu.core.settings import settings
 from cashu.wallet.wallet import Wallet
 from cashu.wallet.wallet import Wallet as Wallet1
 from cashu.wallet.wallet import Wallet as Wallet2
@@ -173,6 +174,36 @@ async def test_restore_wallet_after_mint(wallet3: Wallet):
     assert all([p.dleq.s for p in wallet3.proofs])  # type: ignore
 
 
+@pytest.mark.asyncio
+async def test_restore_promises_in_batches(wallet3: Wallet, monkeypatch):
+    await reset_wallet_db(wallet3)
+    mint_quote = await wallet3.request_mint(63)
+    await pay_if_regtest(mint_quote.request)
+    await wallet3.mint(63, quote_id=mint_quote.quote)
+    assert len(wallet3.proofs) == 6
+
+    secrets, rs, derivation_paths = await wallet3.generate_secrets_from_to(0, 20)
+    outputs, _ = wallet3._construct_outputs([1] * len(secrets), secrets, rs)
+
+    # restore all outputs in a single request
+    await reset_wallet_db(wallet3)
+    index_single, proofs_single = await wallet3.restore_promises(
+        outputs, secrets, rs, derivation_paths
+    )
+    assert len(proofs_single) == 6
+
+    # restore the same outputs in batches of 4
+    monkeypatch.setattr(settings, "restore_batch_size", 4)
+    await reset_wallet_db(wallet3)
+    index_batched, proofs_batched = await wallet3.restore_promises(
+        outputs, secrets, rs, derivation_paths
+    )
+    assert index_batched == index_single
+    assert [p.secret for p in proofs_batched] == [p.secret for p in proofs_single]
+    assert [p.amount for p in proofs_batched] == [p.amount for p in proofs_single]
+    assert [p.C for p in proofs_batched] == [p.C for p in proofs_single]
+
+
 @pytest.mark.asyncio
 async def test_restore_wallet_with_invalid_mnemonic(wallet3: Wallet):
     await assert_err(